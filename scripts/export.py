@@ -1,13 +1,31 @@
-import json
 from pathlib import Path
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+
+import orjson
+
+
+def _json_default(obj):
+    # enregistrements compacts (NamedTuple, ex. sources.an.Vote) -> objets JSON
+    if hasattr(obj, "as_json"):
+        return obj.as_json()
+    if hasattr(obj, "_asdict"):
+        return obj._asdict()
+    raise TypeError
 
 
 def _write_json(path: Path, obj: dict):
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
+    path.write_bytes(
+        orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_NON_STR_KEYS,
+        )
     )
 
 
@@ -17,11 +35,19 @@ def export_all(data_dir: Path, scrutins: list[dict], generated_at: str):
     - data/index.json (liste filtrable)
     - data/people.json (référentiel minimal)
     - data/scrutins/YYYY.json (détails + votes)
+
+    Les fichiers sont écrits en parallèle (pool de threads) pendant que la
+    suite de l'export est calculée.
     """
-    # index léger
-    index_items = []
-    for s in scrutins:
-        index_items.append(
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = []
+
+        # un seul tri (date, id) décroissant, partagé par l'index et les fichiers
+        # annuels (les années y sont contiguës)
+        scrutins_sorted = sorted(scrutins, key=itemgetter("date", "id"), reverse=True)
+
+        # index léger
+        index_items = [
             {
                 "id": s["id"],
                 "chamber": s["chamber"],
@@ -33,33 +59,47 @@ def export_all(data_dir: Path, scrutins: list[dict], generated_at: str):
                 "themes": s.get("themes", []),
                 "source_url": s.get("source_url"),
             }
+            for s in scrutins_sorted
+        ]
+        futures.append(
+            ex.submit(_write_json, data_dir / "index.json", {"generated_at": generated_at, "scrutins": index_items})
         )
-    index_items.sort(key=lambda x: (x["date"], x["id"]), reverse=True)
-    _write_json(data_dir / "index.json", {"generated_at": generated_at, "scrutins": index_items})
 
-    # people minimal (on enrichira plus tard)
-    people_map = {}
-    for s in scrutins:
-        for v in s.get("votes", []):
-            pid = v["person_id"]
-            if pid not in people_map:
-                people_map[pid] = {"person_id": pid, "name": v.get("name"), "chamber": s["chamber"]}
-            if v.get("group"):
-                people_map[pid]["group"] = v["group"]
-            if v.get("constituency"):
-                people_map[pid]["constituency"] = v["constituency"]
-            if v.get("name"):
-                people_map[pid]["name"] = v["name"]
+        # people minimal (on enrichira plus tard)
+        people_map = {}
+        get_person = people_map.get
+        for s in scrutins:
+            chamber = s["chamber"]
+            for v in s.get("votes", ()):
+                pid = v.person_id
+                name = v.name
+                entry = get_person(pid)
+                if entry is None:
+                    entry = {"person_id": pid, "name": name, "chamber": chamber}
+                    people_map[pid] = entry
+                group = v.group
+                if group:
+                    entry["group"] = group
+                constituency = v.constituency
+                if constituency:
+                    entry["constituency"] = constituency
+                if name:
+                    entry["name"] = name
 
-    people_list = sorted(people_map.values(), key=lambda p: ((p.get("name") or ""), p["person_id"]))
-    _write_json(data_dir / "people.json", {"generated_at": generated_at, "people": people_list})
+        people_list = sorted(people_map.values(), key=lambda p: ((p.get("name") or ""), p["person_id"]))
+        futures.append(
+            ex.submit(_write_json, data_dir / "people.json", {"generated_at": generated_at, "people": people_list})
+        )
 
-    # détails par année
-    by_year = defaultdict(list)
-    for s in scrutins:
-        year = int(s["date"][:4])
-        by_year[year].append(s)
+        # détails par année
+        for year, items in groupby(scrutins_sorted, key=lambda x: x["date"][:4]):
+            futures.append(
+                ex.submit(
+                    _write_json,
+                    data_dir / "scrutins" / f"{year}.json",
+                    {"year": int(year), "scrutins": list(items)},
+                )
+            )
 
-    for year, items in by_year.items():
-        items.sort(key=lambda x: (x["date"], x["id"]), reverse=True)
-        _write_json(data_dir / "scrutins" / f"{year}.json", {"year": year, "scrutins": items})
\ No newline at end of file
+        for f in futures:
+            f.result()  # propage une éventuelle erreur d'écriture
@@ -1,8 +1,15 @@
+import mmap
+import os
+import shutil
+import sys
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import json
+from typing import NamedTuple
 
 import httpx
+import ijson
+import orjson
 from lxml import etree
 
 AN_LEGISLATURE = "17"
@@ -28,20 +35,76 @@ def _cache_dir() -> Path:
 
 
 def _download(url: str, dest: Path):
+    """
+    Télécharge `url` vers `dest` avec un GET conditionnel: l'ETag et le
+    Last-Modified de la réponse sont conservés à côté du fichier, et si le
+    serveur répond 304 le fichier en cache est gardé tel quel. Un fichier en
+    cache sans aucun de ces validateurs n'est pas revalidé (pas de requête).
+    """
     dest.parent.mkdir(parents=True, exist_ok=True)
-    print(f"📥 Téléchargement de {dest.name}...")
-    with httpx.stream("GET", url, timeout=120.0, follow_redirects=True) as r:
-        r.raise_for_status()
-        with open(dest, "wb") as f:
-            for chunk in r.iter_bytes():
-                f.write(chunk)
+    meta_path = dest.with_name(dest.name + ".http.json")
+
+    headers = {}
+    if dest.exists():
+        meta = orjson.loads(meta_path.read_bytes()) if meta_path.exists() else {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        if not headers:
+            print(f"✅ {dest.name} déjà en cache")
+            return
+
+    tmp = dest.with_name(dest.name + ".part")
+    try:
+        with httpx.stream("GET", url, headers=headers, timeout=120.0, follow_redirects=True) as r:
+            if r.status_code == 304:
+                print(f"✅ {dest.name} à jour (cache)")
+                return
+            r.raise_for_status()
+            print(f"📥 Téléchargement de {dest.name}...")
+            with open(tmp, "wb") as f:
+                for chunk in r.iter_bytes():
+                    f.write(chunk)
+            meta = {
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+            }
+    except httpx.HTTPError as e:
+        tmp.unlink(missing_ok=True)
+        if not dest.exists():
+            raise
+        print(f"⚠️ {dest.name}: téléchargement impossible ({e}), utilisation du cache")
+        return
+
+    tmp.replace(dest)
+    meta_path.write_bytes(orjson.dumps(meta))
     print(f"✅ {dest.name} téléchargé")
 
 
+def _extract_zip(zip_path: Path, dest: Path) -> list[Path]:
+    """
+    Extrait le ZIP une fois dans `dest` (ré-extraction seulement si le ZIP est
+    plus récent que la dernière extraction) et retourne les chemins des XML,
+    dans l'ordre du ZIP.
+    """
+    stamp = dest / ".extracted"
+    with zipfile.ZipFile(zip_path) as zf:
+        # dict.fromkeys: un membre dupliqué dans le ZIP n'est extrait qu'en un fichier
+        xml_files = list(dict.fromkeys(n for n in zf.namelist() if n.endswith(".xml")))
+        if not stamp.exists() or stamp.stat().st_mtime < zip_path.stat().st_mtime:
+            print(f"📦 Extraction de {zip_path.name}...")
+            shutil.rmtree(dest, ignore_errors=True)
+            zf.extractall(dest)
+            stamp.touch()
+    return [dest / n for n in xml_files]
+
+
 def _date_only(s: str | None) -> str | None:
     if not s:
         return None
-    return s.strip().split("T")[0]
+    # format AN: YYYY-MM-DD[Thh:mm:ss...]
+    return s.strip()[:10] or None
 
 
 def _norm_result(s: str | None) -> str | None:
@@ -55,8 +118,41 @@ def _norm_result(s: str | None) -> str | None:
     return low
 
 
-def _first_text(node, local_name: str) -> str | None:
-    v = node.xpath(f"string(.//*[local-name()='{local_name}'][1])")
+def _strip_namespaces(root) -> None:
+    """
+    Retire le namespace (unique) des tags une fois après le parsing: les tags
+    peuvent ensuite être comparés directement ("pour", "contre", ...).
+    """
+    for e in root.iter(etree.Element):
+        e.tag = e.tag.rpartition("}")[2]
+    etree.cleanup_namespaces(root)
+
+
+# XPath compilées une seule fois au chargement du module (évite de recompiler
+# l'expression à chaque scrutin). Elles supposent des tags sans namespace
+# (cf. _strip_namespaces).
+def _xp_first(path: str) -> etree.XPath:
+    return etree.XPath(f"string(.//{path}[1])")
+
+
+_XP_NUMERO = _xp_first("numero")
+_XP_DATE = _xp_first("dateScrutin")
+_XP_OBJET = _xp_first("objet")
+_XP_SCRUTIN_TYPE = _xp_first("typeScrutin//libelle")
+_XP_RESULT = _xp_first("syntheseVote//resultat")
+_XP_COUNTS = {
+    k: _xp_first(f"decompte//{lname}")
+    for k, lname in [
+        ("for", "pour"),
+        ("against", "contre"),
+        ("abstention", "abstention"),
+        ("nonvoting", "nonVotant"),
+    ]
+}
+
+
+def _first_text(node, xp: etree.XPath) -> str | None:
+    v = xp(node)
     v = v.strip() if isinstance(v, str) else ""
     return v or None
 
@@ -65,154 +161,220 @@ def _first_text(node, local_name: str) -> str | None:
 # Votes
 # ---------------------------------------------------------------------------
 
-def _extract_votes(scrutin_node) -> list[dict]:
-    votes = []
-
-    bucket_to_pos = {
-        "pour": "FOR",
-        "pours": "FOR",
-        "contre": "AGAINST",
-        "contres": "AGAINST",
-        "abstention": "ABSTAIN",
-        "abstentions": "ABSTAIN",
-        "nonVotant": "NONVOTING",
-        "nonvotant": "NONVOTING",
-        "nonVotants": "NONVOTING",
-    }
-
-    actor_nodes = scrutin_node.xpath(".//*[local-name()='acteurRef']")
-    for a in actor_nodes:
-        pid = (a.text or "").strip()
-        if not pid:
-            continue
-
-        pos = None
-        group = None
-
-        cur = a
-        for _ in range(30):
-            cur = cur.getparent()
-            if cur is None:
-                break
-
-            lname = cur.tag.split("}")[-1]
-
-            if pos is None and lname in bucket_to_pos:
-                pos = bucket_to_pos[lname]
-
-            if group is None:
-                g = cur.xpath("string(.//*[local-name()='organeRef'][1])")
-                g = g.strip() if isinstance(g, str) else ""
-                if g:
-                    group = g
-
-            if pos and group:
-                break
+# tag du bloc de votes -> position (construit une fois au chargement du module)
+_BUCKET_TO_POS = {
+    "pour": "FOR",
+    "pours": "FOR",
+    "contre": "AGAINST",
+    "contres": "AGAINST",
+    "abstention": "ABSTAIN",
+    "abstentions": "ABSTAIN",
+    "nonVotant": "NONVOTING",
+    "nonvotant": "NONVOTING",
+    "nonVotants": "NONVOTING",
+}
+
+
+class Vote(NamedTuple):
+    """
+    Vote nominatif d'un député sur un scrutin.
+    Enregistrement compact (tuple) pendant le traitement, converti en dict
+    uniquement à l'écriture JSON (cf. as_json, export._write_json).
+    """
 
-        if not pos:
+    person_id: str
+    position: str
+    group: str | None
+    constituency: str | None = None
+    name: str | None = None
+    group_name: str | None = None
+    group_acronym: str | None = None
+
+    def as_json(self) -> dict:
+        # même forme qu'avant: libellé / sigle du groupe seulement si le vote en a un
+        d = self._asdict()
+        if self.group is None:
+            del d["group_name"], d["group_acronym"]
+        return d
+
+
+def _extract_votes(
+    scrutin_node,
+    acteurs_name: dict[str, str],
+    organes_name: dict[str, str],
+    organes_acronym: dict[str, str],
+) -> list[Vote]:
+    """
+    Extrait les votes nominatifs du scrutin, enrichis au passage avec le nom
+    du député et le libellé / sigle de son groupe (cf. fetch_an_acteurs).
+    """
+    # person_id -> vote: un seul vote par député et par scrutin. Le premier
+    # l'emporte: c'est celui de ventilationVotes (décompte officiel), un
+    # éventuel <miseAuPoint> en fin de fichier réutilise les mêmes tags.
+    votes: dict[str, Vote] = {}
+
+    bucket_to_pos = _BUCKET_TO_POS
+
+    # Parcours unique de l'arbre: on maintient la position (pour/contre/...)
+    # et le groupe (organeRef du <groupe> englobant) courants dans des piles,
+    # et chaque acteurRef émet un vote au moment où on le rencontre.
+    pos_stack = [None]
+    group_stack = [None]
+
+    for event, node in etree.iterwalk(scrutin_node, events=("start", "end")):
+        tag = node.tag
+        if event == "end":
+            if tag in bucket_to_pos:
+                pos_stack.pop()
+            elif tag == "groupe":
+                group_stack.pop()
             continue
 
-        votes.append(
-            {
-                "person_id": pid,
-                "position": pos,
-                "group": group,
-                "constituency": None,
-                "name": None,
-            }
-        )
-
-    # dédoublonnage
-    seen = set()
-    uniq = []
-    for v in votes:
-        k = (v["person_id"], v["position"], v["group"])
-        if k in seen:
-            continue
-        seen.add(k)
-        uniq.append(v)
+        if tag in bucket_to_pos:
+            pos_stack.append(bucket_to_pos[tag])
+        elif tag == "groupe":
+            group_stack.append(None)
+        elif tag == "organeRef":
+            if group_stack[-1] is None:
+                group_stack[-1] = (node.text or "").strip() or None
+        elif tag == "acteurRef":
+            pid = (node.text or "").strip()
+            pos = pos_stack[-1]
+            if not pid or not pos or pid in votes:
+                continue
+            group = group_stack[-1]
+            votes[pid] = Vote(
+                pid,
+                pos,
+                group,
+                name=acteurs_name.get(pid, "Inconnu"),
+                group_name=organes_name.get(group) if group else None,
+                group_acronym=organes_acronym.get(group) if group else None,
+            )
 
-    return uniq
+    return list(votes.values())
 
 
 # ---------------------------------------------------------------------------
 # Scrutin XML
 # ---------------------------------------------------------------------------
 
-def _parse_one_xml(fileobj) -> list[dict]:
+def _parse_one_xml(
+    fileobj,
+    acteurs_name: dict[str, str],
+    organes_name: dict[str, str],
+    organes_acronym: dict[str, str],
+) -> list[dict]:
     try:
-        tree = etree.parse(fileobj)
-        el = tree.getroot()
-
-        numero = _first_text(el, "numero") or "UNKNOWN"
-        date = _date_only(_first_text(el, "dateScrutin")) or "1970-01-01"
-        title = _first_text(el, "objet") or "(sans titre)"
-
-        scrutin_type = (
-            el.xpath(
-                "string(.//*[local-name()='typeScrutin']"
-                "//*[local-name()='libelle'][1])"
-            ).strip()
-            or None
-        )
-
-        result_status = _norm_result(
-            el.xpath(
-                "string(.//*[local-name()='syntheseVote']"
-                "//*[local-name()='resultat'][1])"
-            ).strip()
-            or None
-        )
-
-        counts = {}
-
-        def count_of(name: str):
-            v = el.xpath(
-                f"string(.//*[local-name()='decompte']"
-                f"//*[local-name()='{name}'][1])"
-            )
-            v = v.strip() if isinstance(v, str) else ""
-            return int(v) if v.isdigit() else None
-
-        for k, lname in [
-            ("for", "pour"),
-            ("against", "contre"),
-            ("abstention", "abstention"),
-            ("nonvoting", "nonVotant"),
-        ]:
-            c = count_of(lname)
-            if c is not None:
-                counts[k] = c
-
-        votes = _extract_votes(el)
-
-        return [
-            {
-                "id": f"AN-{AN_LEGISLATURE}-{numero}",
-                "date": date,
-                "title": title,
-                "object": None,
-                "scrutin_type": scrutin_type,
-                "result_status": result_status,
-                "counts": counts or None,
-                "source_url": None,
-                "votes": votes,
-            }
-        ]
+        # Un fichier = un scrutin: iterparse remet directement l'élément
+        # <scrutin>, sans l'enveloppe ElementTree.
+        for _, el in etree.iterparse(
+            fileobj, events=("end",), tag="{*}scrutin", huge_tree=True
+        ):
+            _strip_namespaces(el)
+
+            numero = _first_text(el, _XP_NUMERO) or "UNKNOWN"
+            date = _date_only(_first_text(el, _XP_DATE)) or "1970-01-01"
+            title = _first_text(el, _XP_OBJET) or "(sans titre)"
+
+            scrutin_type = _first_text(el, _XP_SCRUTIN_TYPE)
+            result_status = _norm_result(_first_text(el, _XP_RESULT))
+
+            counts = {}
+            for k, xp in _XP_COUNTS.items():
+                v = _first_text(el, xp) or ""
+                if v.isdigit():
+                    counts[k] = int(v)
+
+            votes = _extract_votes(el, acteurs_name, organes_name, organes_acronym)
+
+            return [
+                {
+                    "id": f"AN-{AN_LEGISLATURE}-{numero}",
+                    "date": date,
+                    "title": title,
+                    "object": None,
+                    "scrutin_type": scrutin_type,
+                    "result_status": result_status,
+                    "counts": counts or None,
+                    "source_url": None,
+                    "votes": votes,
+                }
+            ]
+
+        return []
 
     except Exception:
         return []
 
 
+# Référentiels acteurs / organes, transmis une seule fois à chaque worker
+# (cf. _init_worker) plutôt qu'à chaque fichier.
+_WORKER_REFS: tuple[dict[str, str], dict[str, str], dict[str, str]] = ({}, {}, {})
+
+
+def _init_worker(
+    acteurs_name: dict[str, str],
+    organes_name: dict[str, str],
+    organes_acronym: dict[str, str],
+):
+    global _WORKER_REFS
+    _WORKER_REFS = (acteurs_name, organes_name, organes_acronym)
+
+
+def _parse_one_xml_path(path: str) -> list[dict]:
+    # Point d'entrée des workers du ProcessPoolExecutor (picklable): le
+    # fichier extrait est mappé en mémoire, servi par le cache de pages de l'OS.
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse_one_xml(mm, *_WORKER_REFS)
+
+
 # ---------------------------------------------------------------------------
 # Acteurs & organes
 # ---------------------------------------------------------------------------
 
-def fetch_an_acteurs() -> tuple[dict, dict]:
+# Préfixes ijson des acteurs / organes dans le JSON composite, avec ou sans
+# l'enveloppe `export`, et que l'entrée soit une liste ou un objet isolé.
+_COMPOSITE_PREFIXES = {
+    f"{root}{path}{suffix}": kind
+    for root in ("", "export.")
+    for path, kind in (("acteurs.acteur", "acteur"), ("organes.organe", "organe"))
+    for suffix in (".item", "")
+}
+
+
+def _iter_composite_items(fileobj):
+    """
+    Lit le JSON composite en streaming (ijson) et produit des tuples
+    (kind, dict) pour chaque acteur / organe, sans construire l'arbre complet.
     """
-    Télécharge et parse le(s) dump(s) AN pour:
-    - acteurs (députés) : uid -> name
-    - organes (groupes) : uid -> name + acronym
+    builder = None
+    current = None
+    kind = None
+    for prefix, event, value in ijson.parse(fileobj):
+        if builder is None:
+            if event == "start_map" and prefix in _COMPOSITE_PREFIXES:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                current = prefix
+                kind = _COMPOSITE_PREFIXES[prefix]
+            continue
+
+        builder.event(event, value)
+        if event == "end_map" and prefix == current:
+            yield kind, builder.value
+            builder = None
+
+
+def fetch_an_acteurs() -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    """
+    Télécharge et parse le(s) dump(s) AN et retourne trois index à plat:
+    - acteurs_name (députés) : uid -> name
+    - organes_name (groupes) : uid -> name
+    - organes_acronym (groupes) : uid -> acronym
 
     IMPORTANT: selon les dépôts AN, le ZIP peut contenir:
       1) un JSON composite unique (souvent enveloppé dans `export`)
@@ -228,21 +390,14 @@ def fetch_an_acteurs() -> tuple[dict, dict]:
             return x.strip()
         return ""
 
-    def as_list(x):
-        if x is None:
-            return []
-        if isinstance(x, list):
-            return x
-        return [x]
-
     cache = _cache_dir()
     zip_path = cache / "Acteurs.json.zip"
 
-    if not zip_path.exists():
-        _download(AN_ACTEURS_URL, zip_path)
+    _download(AN_ACTEURS_URL, zip_path)
 
-    acteurs: dict[str, dict] = {}
-    organes: dict[str, dict] = {}
+    acteurs_name: dict[str, str] = {}
+    organes_name: dict[str, str] = {}
+    organes_acronym: dict[str, str] = {}
 
     with zipfile.ZipFile(zip_path) as zf:
         names = zf.namelist()
@@ -254,40 +409,28 @@ def fetch_an_acteurs() -> tuple[dict, dict]:
             # (Sinon, on bascule sur le mode multi-fichiers plus bas.)
             if len(json_files) <= 5:
                 with zf.open(json_files[0]) as f:
-                    data = json.load(f)
-
-                root = data.get("export", data)
-
-                # acteurs
-                for a in as_list((root.get("acteurs") or {}).get("acteur")):
-                    if not isinstance(a, dict):
-                        continue
-                    uid = get_text(a.get("uid"))
-                    if not uid:
-                        continue
-                    ident = ((a.get("etatCivil") or {}).get("ident") or {})
-                    prenom = get_text(ident.get("prenom"))
-                    nom = get_text(ident.get("nom"))
-                    full_name = f"{prenom} {nom}".strip()
-                    acteurs[uid] = {"name": full_name or "Inconnu"}
-
-                # organes
-                for o in as_list((root.get("organes") or {}).get("organe")):
-                    if not isinstance(o, dict):
-                        continue
-                    oid = get_text(o.get("uid"))
-                    if not oid:
-                        continue
-                    libelle = get_text(o.get("libelle"))
-                    libelle_abrege = get_text(o.get("libelleAbrege")) or get_text(o.get("libelleAbrev"))
-                    organes[oid] = {
-                        "name": libelle or "Groupe inconnu",
-                        "acronym": libelle_abrege or "",
-                    }
-
-                print(f"✅ {len(acteurs)} acteurs chargés")
-                print(f"✅ {len(organes)} organes chargés")
-                return acteurs, organes
+                    for kind, obj in _iter_composite_items(f):
+                        if kind == "acteur":
+                            uid = get_text(obj.get("uid"))
+                            if not uid:
+                                continue
+                            ident = ((obj.get("etatCivil") or {}).get("ident") or {})
+                            prenom = get_text(ident.get("prenom"))
+                            nom = get_text(ident.get("nom"))
+                            full_name = f"{prenom} {nom}".strip()
+                            acteurs_name[uid] = full_name or "Inconnu"
+                        else:
+                            oid = get_text(obj.get("uid"))
+                            if not oid:
+                                continue
+                            libelle = get_text(obj.get("libelle"))
+                            libelle_abrege = get_text(obj.get("libelleAbrege")) or get_text(obj.get("libelleAbrev"))
+                            organes_name[oid] = libelle or "Groupe inconnu"
+                            organes_acronym[oid] = libelle_abrege or ""
+
+                print(f"✅ {len(acteurs_name)} acteurs chargés")
+                print(f"✅ {len(organes_name)} organes chargés")
+                return acteurs_name, organes_name, organes_acronym
 
         # --- Cas 2: ZIP multi-fichiers (json/acteur/*.json, json/organe/*.json) ---
         acteur_files = [n for n in names if n.lower().startswith("json/acteur/") and n.lower().endswith(".json")]
@@ -302,7 +445,7 @@ def fetch_an_acteurs() -> tuple[dict, dict]:
         # Parse acteurs unitaires
         for name in acteur_files:
             with zf.open(name) as f:
-                data = json.load(f)
+                data = orjson.loads(f.read())
             a = data.get("acteur")
             if not isinstance(a, dict):
                 continue
@@ -316,12 +459,12 @@ def fetch_an_acteurs() -> tuple[dict, dict]:
             nom = get_text(ident.get("nom"))
             full_name = f"{prenom} {nom}".strip()
 
-            acteurs[uid] = {"name": full_name or "Inconnu"}
+            acteurs_name[uid] = full_name or "Inconnu"
 
         # Parse organes unitaires
         for name in organe_files:
             with zf.open(name) as f:
-                data = json.load(f)
+                data = orjson.loads(f.read())
             o = data.get("organe")
             if not isinstance(o, dict):
                 continue
@@ -333,14 +476,12 @@ def fetch_an_acteurs() -> tuple[dict, dict]:
             libelle = get_text(o.get("libelle"))
             libelle_abrege = get_text(o.get("libelleAbrege")) or get_text(o.get("libelleAbrev"))
 
-            organes[oid] = {
-                "name": libelle or "Groupe inconnu",
-                "acronym": libelle_abrege or "",
-            }
+            organes_name[oid] = libelle or "Groupe inconnu"
+            organes_acronym[oid] = libelle_abrege or ""
 
-    print(f"✅ {len(acteurs)} acteurs chargés")
-    print(f"✅ {len(organes)} organes chargés")
-    return acteurs, organes
+    print(f"✅ {len(acteurs_name)} acteurs chargés")
+    print(f"✅ {len(organes_name)} organes chargés")
+    return acteurs_name, organes_name, organes_acronym
 
 
 # ---------------------------------------------------------------------------
@@ -349,38 +490,52 @@ def fetch_an_acteurs() -> tuple[dict, dict]:
 
 def fetch_an_scrutins(limit: int = 200) -> list[dict]:
     print("📥 Chargement acteurs / organes…")
-    acteurs, organes = fetch_an_acteurs()
+    acteurs_name, organes_name, organes_acronym = fetch_an_acteurs()
 
     cache = _cache_dir()
     zip_path = cache / "Scrutins.xml.zip"
-    if not zip_path.exists():
-        _download(AN_ZIP_URL, zip_path)
-
-    scrutins = []
-    with zipfile.ZipFile(zip_path) as zf:
-        xml_files = [n for n in zf.namelist() if n.endswith(".xml")]
-        for i, name in enumerate(xml_files):
+    _download(AN_ZIP_URL, zip_path)
+
+    xml_files = _extract_zip(zip_path, cache / "scrutins_xml")
+
+    # Le parsing lxml est CPU-bound et indépendant d'un fichier à l'autre:
+    # on le répartit sur plusieurs processus (contourne le GIL). Les votes
+    # sont enrichis (noms, groupes) pendant le parsing, sans seconde passe.
+    by_id: dict[str, dict] = {}
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(acteurs_name, organes_name, organes_acronym),
+    ) as ex:
+        paths = [str(p) for p in xml_files]
+        for i, parsed in enumerate(ex.map(_parse_one_xml_path, paths, chunksize=64)):
             if i % 500 == 0:
-                print(f"   … {i}/{len(xml_files)}")
-            with zf.open(name) as f:
-                scrutins.extend(_parse_one_xml(f))
+                print(f"   … {i}/{len(paths)}")
+            for s in parsed:
+                by_id[s["id"]] = s
 
-    print(f"✅ {len(scrutins)} scrutins parsés")
+    print(f"✅ {len(by_id)} scrutins parsés")
 
-    for s in scrutins:
-        for v in s["votes"]:
-            pid = v["person_id"]
-            gid = v["group"]
-            v["name"] = acteurs.get(pid, {}).get("name", "Inconnu")
-            if gid:
-                v["group_name"] = organes.get(gid, {}).get("name")
-                v["group_acronym"] = organes.get(gid, {}).get("acronym")
-
-    uniq = {s["id"]: s for s in scrutins}
     scrutins = sorted(
-        uniq.values(),
+        by_id.values(),
         key=lambda s: (s["date"], s["id"]),
         reverse=True,
     )
 
-    return scrutins[:limit]
\ No newline at end of file
+    scrutins = scrutins[:limit]
+
+    # Champs très répétés, internés une fois dans le processus principal (les
+    # chaînes dépicklées depuis les workers sont des objets distincts), et
+    # seulement pour les scrutins effectivement retournés.
+    intern = sys.intern
+    for s in scrutins:
+        s["votes"] = [
+            v._replace(
+                person_id=intern(v.person_id),
+                position=intern(v.position),
+                group=intern(v.group) if v.group else None,
+            )
+            for v in s["votes"]
+        ]
+
+    return scrutins
\ No newline at end of file
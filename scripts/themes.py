@@ -1,6 +1,12 @@
-import json
 from pathlib import Path
 
+import orjson
+
+try:
+    import ahocorasick
+except ImportError:  # repli sur un simple scan par sous-chaîne
+    ahocorasick = None
+
 
 def load_themes(path: Path) -> dict:
     """
@@ -9,7 +15,48 @@ def load_themes(path: Path) -> dict:
     """
     if not path.exists():
         return {"themes": [], "overrides": {}}
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
+
+
+def _keyword_matcher(themes: list[dict]):
+    """
+    Retourne une fonction `hay -> set(slugs)` qui détecte tous les thèmes
+    dont au moins un mot-clé apparaît dans `hay` (déjà en minuscules).
+
+    Avec pyahocorasick, tous les mots-clés sont compilés en un seul automate:
+    un seul parcours du texte par scrutin, quel que soit le nombre de mots-clés.
+    """
+    if ahocorasick is None:
+        # mots-clés mis en minuscules une fois; any() s'arrête au premier trouvé
+        theme_kws = [
+            (t["slug"], [kw.lower() for kw in t.get("keywords", [])])
+            for t in themes
+        ]
+
+        def match(hay: str) -> set:
+            return {slug for slug, kws in theme_kws if any(kw in hay for kw in kws)}
+
+        return match
+
+    by_kw: dict[str, set] = {}
+    for t in themes:
+        for kw in t.get("keywords", []):
+            by_kw.setdefault(kw.lower(), set()).add(t["slug"])
+    if not by_kw:
+        return lambda hay: set()
+
+    automaton = ahocorasick.Automaton()
+    for kw, slugs in by_kw.items():
+        automaton.add_word(kw, tuple(slugs))
+    automaton.make_automaton()
+
+    def match(hay: str) -> set:
+        found = set()
+        for _, slugs in automaton.iter(hay):
+            found.update(slugs)
+        return found
+
+    return match
 
 
 def assign_themes(scrutins: list[dict], cfg: dict) -> list[dict]:
@@ -20,6 +67,7 @@ def assign_themes(scrutins: list[dict], cfg: dict) -> list[dict]:
     """
     themes = cfg.get("themes", [])
     overrides = cfg.get("overrides", {})
+    match = _keyword_matcher(themes)
 
     for s in scrutins:
         sid = s["id"]
@@ -31,13 +79,8 @@ def assign_themes(scrutins: list[dict], cfg: dict) -> list[dict]:
 
         # 2) mots-clés
         hay = f'{s.get("title","")} {s.get("object","")}'.lower()
-        found = []
-        for t in themes:
-            for kw in t.get("keywords", []):
-                if kw.lower() in hay:
-                    found.append(t["slug"])
-                    break
-
-        s["themes"] = sorted(set(found)) if found else ["autre"]
+        found = match(hay)
+
+        s["themes"] = sorted(found) if found else ["autre"]
 
     return scrutins
\ No newline at end of file